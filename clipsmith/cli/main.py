@@ -3,33 +3,15 @@ CLI entry point.
 """
 
 import logging
+import os
 import sys
 from pathlib import Path
 
-import rich.traceback
 import typer
-from rich.console import Console
-from rich.logging import RichHandler
 
 from ..clip import DurationParams, OperationParams, ResolutionParams
 from ..context import Context
 
-rich.traceback.install(show_locals=True)
-
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(message)s",
-    handlers=[
-        RichHandler(
-            rich_tracebacks=True,
-            console=Console(highlight=False),
-            show_level=True,
-            show_time=True,
-            show_path=False,
-        )
-    ],
-)
-
 app = typer.Typer(
     rich_markup_mode="rich",
     no_args_is_help=True,
@@ -83,18 +65,22 @@ def forge(
         help="Whether to store a cache of video metadata in input folder(s)",
     ),
     log_level: str = typer.Option("info", help="Log level passed to ffmpeg"),
+    jobs: int = typer.Option(
+        max(1, (os.cpu_count() or 1) // 4),
+        help="Number of forge tasks to run concurrently",
+    ),
+    threads: int
+    | None = typer.Option(
+        None,
+        help="Thread count passed to ffmpeg when re-encoding (default: one per core)",
+    ),
 ):
     """
     Create a video from one or more videos with specified operations applied
     """
 
-    def parse_res(res: str) -> tuple[int, int]:
-        split = res.split(":")
-        assert len(split) == 2, f"Invalid resolution: {res}"
-        return int(split[0]), int(split[1])
-
     # convert resolution target as typer assumes there can be multiple tuples
-    res_target_ = None if res_target is None else parse_res(res_target)
+    res_target_ = None if res_target is None else _parse_res(res_target)
 
     # setup context and operation
     context = Context()
@@ -112,6 +98,7 @@ def forge(
         audio=audio,
         recurse=recurse,
         cache=cache,
+        threads=threads,
         log_level=log_level,
     )
 
@@ -124,12 +111,23 @@ def forge(
 
     # do it
     try:
-        context.doit()
+        context.doit(jobs=jobs)
     except ChildProcessError:
         logging.error(f"Failed to run doit tasks")
         sys.exit(1)
 
 
+def _parse_res(res: str) -> tuple[int, int]:
+    """
+    Parse resolution given as WIDTH:HEIGHT.
+    """
+    width, sep, height = res.partition(":")
+    assert (
+        sep and width.isdigit() and height.isdigit()
+    ), f"Invalid resolution: {res}"
+    return int(width), int(height)
+
+
 # TODO: after playbooks implemented
 # @app.command()
 # def playbook(
@@ -148,7 +146,38 @@ def forge(
 #    """
 
 
+def _setup_logging():
+    """
+    Configure logging upon CLI startup, deferring the rich imports so
+    `--help` and library consumers don't pay their cost.
+    """
+    if sys.stderr.isatty():
+        import rich.traceback
+        from rich.console import Console
+        from rich.logging import RichHandler
+
+        rich.traceback.install(show_locals=True)
+
+        handler = RichHandler(
+            rich_tracebacks=True,
+            console=Console(highlight=False),
+            show_level=True,
+            show_time=True,
+            show_path=False,
+        )
+    else:
+        # plain handler for CI/pipe contexts
+        handler = logging.StreamHandler()
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(message)s",
+        handlers=[handler],
+    )
+
+
 def run():
+    _setup_logging()
     app()
 
 
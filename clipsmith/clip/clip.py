@@ -1,18 +1,19 @@
 from __future__ import annotations
 
 import logging
+import math
 import subprocess
-import tempfile
+from itertools import pairwise
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from doit.task import Task
-
 from .._ffmpeg import get_ffmpeg
 from ..video.base import BaseVideo
 from .operation import OperationParams
 
 if TYPE_CHECKING:
+    from doit.task import Task
+
     from ..context import Context
 
 
@@ -50,6 +51,16 @@ class Clip(BaseVideo):
     Doit task corresponding to operation.
     """
 
+    __out_path: str
+    """
+    Absolute path to output file, resolved once at construction.
+    """
+
+    __input_paths: list[str]
+    """
+    Absolute paths to input files, resolved once at construction.
+    """
+
     def __init__(
         self,
         output: Path,
@@ -63,8 +74,7 @@ class Clip(BaseVideo):
         """
         assert len(inputs), f"No input videos passed"
         assert all(
-            inputs[i].resolution == inputs[i - 1].resolution
-            for i, _ in enumerate(inputs)
+            a.resolution == b.resolution for a, b in pairwise(inputs)
         ), f"Inconsistent input resolutions not currently supported: {inputs}"
         assert (
             output.parent.is_dir()
@@ -85,6 +95,12 @@ class Clip(BaseVideo):
         self.__context = context
         self.__inputs = inputs
         self.__operation = operation
+
+        # resolve paths once; Path.resolve() stats the filesystem and these
+        # are reused across task wiring and argv construction
+        self.__out_path = str(self.path.resolve())
+        self.__input_paths = [str(i.path.resolve()) for i in inputs]
+
         self.__task = self.__prepare_task(inputs)
 
     def reforge(self, output: Path, operation: OperationParams) -> Clip:
@@ -99,13 +115,6 @@ class Clip(BaseVideo):
         """
         return self.__task
 
-    @property
-    def __out_path(self) -> str:
-        """
-        Get absolute path to output file.
-        """
-        return str(self.path.resolve())
-
     def __prepare_task(
         self,
         inputs: list[BaseVideo],
@@ -114,39 +123,86 @@ class Clip(BaseVideo):
         Prepare doit task for creation of this clip from its inputs.
         """
 
-        def action():
-            args = self.__get_args()
-
-            logging.info(f"Invoking ffmpeg: '{' '.join(args)}'")
+        # deferred so importing clipsmith doesn't pay for doit
+        from doit.task import Task
+        from doit.tools import config_changed
 
-            try:
-                subprocess.check_call(args)
-            except subprocess.CalledProcessError:
-                # doit will catch any exceptions and print them, so gracefully
-                # fail the task
-                return False
+        def action():
+            if len(self.__inputs) == 1:
+                return self.__invoke(self.__get_args())
+
+            # multiple inputs: feed list of files to the concat demuxer over
+            # stdin, avoiding a temp file on disk; entries need an explicit
+            # file: prefix so they don't inherit the pipe protocol
+            concat_list = "".join(
+                f"file 'file:{path}'\n" for path in self.__input_paths
+            )
 
-            # get duration from newly written file
-            assert self.path.exists()
-            self._extract_duration()
+            return self.__invoke(
+                self.__get_args(concat_input=True),
+                input_=concat_list.encode(),
+            )
 
-            logging.info(f"Forged clip: '{self.__out_path}'")
+        # rebuild when the operation or input set changes, not just when
+        # input files are newer than the output
+        config = {
+            "inputs": self.__input_paths,
+            "operation": self.__operation.model_dump_json(),
+        }
 
         return Task(
             str(self.path),
             [action],
-            file_dep=[str(i.path) for i in inputs],
+            file_dep=self.__input_paths,
             targets=[self.__out_path],
+            uptodate=[config_changed(config)],
             verbosity=2,
         )
 
-    def __get_args(self) -> list[str]:
+    def __invoke(
+        self, args: list[str], input_: bytes | None = None
+    ) -> bool | None:
+        """
+        Invoke ffmpeg with the given args and optional stdin payload,
+        failing the task gracefully upon error.
+        """
+
+        logging.info(f"Invoking ffmpeg: '{' '.join(args)}'")
+
+        # pin stdin so ffmpeg can't block on interactive prompts; keeping
+        # the invocation free of preexec_fn/cwd preserves the posix_spawn
+        # fast path for process startup
+        stdin_args = (
+            {"input": input_} if input_ else {"stdin": subprocess.DEVNULL}
+        )
+        proc = subprocess.run(
+            args,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            **stdin_args,
+        )
+
+        if proc.returncode != 0:
+            # doit will catch any exceptions and print them, so gracefully
+            # fail the task
+            logging.error(proc.stderr.decode())
+            return False
+
+        # get duration from newly written file
+        assert self.path.exists()
+        self._extract_duration()
+
+        logging.info(f"Forged clip: '{self.__out_path}'")
+
+    def __get_args(self, concat_input: bool = False) -> list[str]:
         """
-        Get ffmpeg args.
+        Get ffmpeg args, reading the concat list from stdin if there are
+        multiple inputs.
         """
 
-        # get original duration based on inputs
-        duration_orig = sum(i.duration for i in self.__inputs)
+        # get original duration based on inputs; fsum keeps the total
+        # accurate over long concat lists
+        duration_orig = math.fsum(i.duration for i in self.__inputs)
 
         # get time scale, if any
         time_scale = self.__operation._get_time_scale(duration_orig)
@@ -154,28 +210,21 @@ class Clip(BaseVideo):
         # get resolution scale, if any
         res_scale = self.__operation._get_res_scale(self.resolution)
 
-        # get full path to all inputs
-        input_paths = [i.path.resolve() for i in self.__inputs]
-
-        if len(input_paths) == 1:
+        if not concat_input:
             # single input, use -i arg
-            input_args = ["-i", str(input_paths[0])]
+            assert len(self.__input_paths) == 1
+            input_args = ["-i", self.__input_paths[0]]
         else:
-            # multiple inputs, use temp file containing list of files
-
-            temp = tempfile.NamedTemporaryFile(
-                mode="w", suffix=".txt", delete=False
-            )
-            temp.writelines([f"file '{str(file)}'\n" for file in input_paths])
-            temp.close()
-
+            # multiple inputs, read list of files from stdin
             input_args = [
                 "-f",
                 "concat",
                 "-safe",
                 "0",
+                "-protocol_whitelist",
+                "file,pipe",
                 "-i",
-                temp.name,
+                "pipe:0",
             ]
 
         # start offset
@@ -186,26 +235,47 @@ class Clip(BaseVideo):
         dur_arg = self.__operation._get_duration_arg(duration_orig)
         dur_args = ["-t", str(dur_arg)] if dur_arg else []
 
+        # time scaling
+        time_filter = f"setpts={time_scale}*PTS" if time_scale else None
+
+        # resolution scaling
+        res_filter = (
+            f"scale={res_scale[0]}:{res_scale[1]}" if res_scale else None
+        )
+
+        filters = [f for f in (time_filter, res_filter) if f]
+
         # these ffmpeg params are mutually exclusive
-        if time_scale or res_scale:
-            # enable video filters (scaling, cropping, etc)
+        if filters:
+            # enable video filters (scaling, cropping, etc) as a single
+            # comma-joined graph
             codec_args = []
-            filter_args = ["-filter:v"]
+            filter_args = ["-filter:v", ",".join(filters)]
+
+            # let libavcodec pick thread count unless capped by user; when
+            # capped, also bound filter threads so concurrent forges don't
+            # oversubscribe cores
+            threads = self.__operation.threads
+            threads_args = ["-threads", str(threads or 0)]
+            if threads:
+                threads_args.extend(["-filter_threads", str(threads)])
         else:
-            # use copy codec
+            # use copy codec; no codec work to parallelize
             codec_args = ["-c", "copy"]
             filter_args = []
-
-        # time scaling
-        time_args = [f"setpts={time_scale}*PTS"] if time_scale else []
-
-        # resolution scaling
-        res_args = [f"scale={res_scale[0]}:{res_scale[1]}"] if res_scale else []
+            threads_args = []
 
         # audio
         # TODO: properly handle audio scaling if time scaling enabled
         audio_args = [] if self.__operation.audio else ["-an"]
 
+        # write mp4-family outputs with the moov atom up front so they're
+        # streamable without a second rewrite pass by consumers
+        if self.path.suffix.lower() in {".mp4", ".mov", ".m4v"}:
+            movflags_args = ["-movflags", "+faststart"]
+        else:
+            movflags_args = []
+
         # notes:
         # - with start offset, the output can be longer since ffmpeg
         #   cuts at the keyframe before the offset
@@ -214,15 +284,16 @@ class Clip(BaseVideo):
         # - need start_args to come before input_args to avoid frozen frames
         #   at beginning of output
 
-        return (
-            [get_ffmpeg(), "-loglevel", self.__operation.log_level]
-            + start_args
-            + input_args
-            + dur_args
-            + codec_args
-            + filter_args
-            + time_args
-            + res_args
-            + audio_args
-            + [self.__out_path]
-        )
+        # build args with a single list to avoid intermediate concatenations
+        args = [get_ffmpeg(), "-loglevel", self.__operation.log_level]
+        args.extend(start_args)
+        args.extend(input_args)
+        args.extend(dur_args)
+        args.extend(codec_args)
+        args.extend(filter_args)
+        args.extend(audio_args)
+        args.extend(movflags_args)
+        args.extend(threads_args)
+        args.append(self.__out_path)
+
+        return args
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from datetime import datetime as DateTime
 from enum import StrEnum
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pydantic import BaseModel, ConfigDict, Field
@@ -130,6 +131,15 @@ class OperationParams(BaseParams):
     Whether to store a cache of video metadata in input folders.
     """
 
+    threads: int | None = None
+    """
+    Thread count passed to ffmpeg when re-encoding, with `None` meaning
+    ffmpeg's default of one thread pool per core. Only applicable when
+    filters are active; the copy codec has no codec work to parallelize.
+    When forging multiple clips concurrently, cap this so that
+    `jobs * threads` is about the core count.
+    """
+
     log_level: LogLevel = LogLevel.FATAL
     """
     Log level passed to ffmpeg.
@@ -164,7 +174,8 @@ class OperationParams(BaseParams):
         elif resolution := self.resolution_params.target:
             pair = resolution
         else:
-            pair = first.resolution
+            # no scaling: input resolution is already an int pair
+            return first.resolution
         return int(pair[0]), int(pair[1])
 
     def _get_time_scale(self, duration_orig: float) -> float | None:
@@ -204,10 +215,10 @@ class OperationParams(BaseParams):
                 return self._get_effective_duration(duration_orig)
         return None
 
-    @property
+    @cached_property
     def _trim_start(self) -> float | None:
         """
-        Get start offset.
+        Get start offset, cached as it's consulted several times per forge.
         """
         # TODO: convert datetime to offset
         if start := self.duration_params.trim_start:
@@ -215,10 +226,10 @@ class OperationParams(BaseParams):
             return start
         return None
 
-    @property
+    @cached_property
     def _trim_end(self) -> float | None:
         """
-        Get end offset.
+        Get end offset, cached as it's consulted several times per forge.
         """
         # TODO: convert datetime to offset
         if end := self.duration_params.trim_end:
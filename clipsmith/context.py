@@ -3,18 +3,20 @@ Encapsulates a set of clips, along with task management functionality to
 create them.
 """
 
-from pathlib import Path
-from typing import Iterable
+from __future__ import annotations
 
-from doit.cmd_base import Command, TaskLoader2
-from doit.doit_cmd import DoitMain
-from doit.task import Task
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable
 
 from .clip.clip import Clip
 from .clip.operation import OperationParams
 from .video.base import BaseVideo
 from .video.raw import RawVideo, RawVideoCache
 
+if TYPE_CHECKING:
+    from doit.task import Task
+
 __all__ = [
     "Context",
 ]
@@ -28,8 +30,15 @@ class Context:
 
     __tasks: list[Task]
 
+    __clips: dict[tuple[str, tuple[str, ...], str], Clip]
+    """
+    Clips keyed by output, inputs, and operation to dedupe repeated
+    forges.
+    """
+
     def __init__(self):
         self.__tasks = []
+        self.__clips = {}
 
     def forge(
         self,
@@ -60,18 +69,38 @@ class Context:
             if not isinstance(v, RawVideo) or v.valid
         ]
 
+        # return existing clip if an identical forge was already requested
+        key = (
+            str(output.resolve()),
+            tuple(str(v.path.resolve()) for v in valid_inputs),
+            operation_.model_dump_json(),
+        )
+
+        if (clip := self.__clips.get(key)) is not None:
+            return clip
+
         clip = Clip(output, valid_inputs, operation_, self)
+
+        self.__clips[key] = clip
         self.__tasks.append(clip._get_task())
 
         return clip
 
-    def doit(self):
+    def doit(self, jobs: int = 1):
         """
         Invoke tasks to build all clips.
 
+        Independent clips are forged concurrently when `jobs` is greater
+        than one, with each ffmpeg invocation running in its own worker.
+
+        :param jobs: Number of tasks to run concurrently
         :raises ChildProcessError: If any ffmpeg invocations failed
         """
 
+        # deferred so importing clipsmith doesn't pay for doit
+        from doit.cmd_base import Command, TaskLoader2
+        from doit.doit_cmd import DoitMain
+
         tasks = self.__tasks
 
         class Loader(TaskLoader2):
@@ -79,10 +108,16 @@ class Context:
                 return tasks
 
             def load_doit_config(self):
-                return {}
+                # check staleness by timestamp+size rather than md5 so
+                # multi-GB inputs aren't re-read on every invocation
+                return {"check_file_uptodate": "timestamp"}
 
         doit_main = DoitMain(task_loader=Loader(), config_filenames=())
-        cmd = ["run"] + [task.name for task in tasks]
+
+        # use thread-based parallelism as task actions are closures, which
+        # can't be pickled for the multi-process runner
+        jobs_args = ["-n", str(jobs), "-P", "thread"] if jobs > 1 else []
+        cmd = ["run"] + jobs_args + [task.name for task in tasks]
 
         ret = doit_main.run(cmd)
         if ret != 0:
@@ -92,7 +127,11 @@ class Context:
 def _normalize_inputs(
     inputs: Iterable[Path | BaseVideo], operation: OperationParams
 ) -> list[BaseVideo]:
-    inputs_ = inputs if isinstance(inputs, Iterable) else [inputs]
+    # explicit scalar check: cheaper than the Iterable ABC dispatch and
+    # robust to iterable scalar types
+    inputs_ = (
+        [inputs] if isinstance(inputs, (Path, BaseVideo)) else list(inputs)
+    )
 
     def process_path(path: Path) -> list[BaseVideo]:
         """
@@ -107,21 +146,26 @@ def _normalize_inputs(
             cache = RawVideoCache(path)
             videos += cache.videos
 
-            # write cache if it doesn't already exist
-            if operation.cache and not cache.cache_path.is_file():
+            # write cache if missing or out of date with folder contents
+            if operation.cache and cache.dirty:
                 cache.write()
 
-            # if recursing, add videos from subfolders
+            # if recursing, add videos from subfolders; scandir reuses
+            # dirent info instead of stat-ing each entry
             if operation.recurse:
-                for folder in sorted(
-                    (
-                        p
-                        for p in path.iterdir()
-                        if p.is_dir() and not p.name.startswith(".")
-                    ),
-                    key=lambda f: f.name,
-                ):
-                    videos += process_path(folder)
+                with os.scandir(path) as entries:
+                    folders = sorted(
+                        (
+                            e
+                            for e in entries
+                            if e.is_dir(follow_symlinks=False)
+                            and not e.name.startswith(".")
+                        ),
+                        key=lambda e: e.name,
+                    )
+
+                for folder in folders:
+                    videos += process_path(Path(folder.path))
 
             return videos
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 import subprocess
 from abc import ABC
 from datetime import datetime as DateTime
@@ -96,70 +97,71 @@ class BaseVideo(ABC):
         self.__duration = duration
 
 
-def _extract_duration(path: Path) -> tuple[float | None, bool]:
+# constant argv segments for the probe helpers, built once; the ffprobe
+# path itself stays a lazy lookup
+_METADATA_ARGS = (
+    "-v",
+    "error",
+    "-select_streams",
+    "v:0",
+    "-show_entries",
+    "stream=width,height:format=duration",
+    "-of",
+    "json",
+)
+
+_DURATION_ARGS = (
+    "-v",
+    "error",
+    "-show_entries",
+    "format=duration",
+    "-of",
+    "default=noprint_wrappers=1:nokey=1",
+)
+
+
+def _extract_metadata(
+    path: Path,
+) -> tuple[float | None, tuple[int, int] | None, bool]:
     """
-    Get duration and validity.
+    Get duration, resolution, and validity with a single ffprobe invocation.
     """
-    assert path.exists()
-
-    cmd = [
-        get_ffprobe(),
-        "-v",
-        "error",
-        "-show_entries",
-        "format=duration",
-        "-of",
-        "default=noprint_wrappers=1:nokey=1",
-        str(path),
-    ]
-
-    pipes = subprocess.Popen(
-        cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE
-    )
-    stdout, stderr = pipes.communicate()
-    stdout = stdout.decode()
-
-    if pipes.returncode != 0 or len(stderr) > 0 or len(stdout) == 0:
-        duration = None
-        valid = False
-    else:
-        duration = float(stdout)
-        valid = True
 
-    return (duration, valid)
+    cmd = [get_ffprobe(), *_METADATA_ARGS, str(path)]
+
+    proc = subprocess.run(cmd, capture_output=True)
+
+    if proc.returncode != 0 or len(proc.stderr) > 0:
+        return (None, None, False)
+
+    probe = json.loads(proc.stdout.decode())
+    streams = probe.get("streams") or []
+    fmt = probe.get("format") or {}
 
+    if not streams or "duration" not in fmt:
+        return (None, None, False)
 
-def _extract_res(path: Path) -> tuple[tuple[int, int] | None, bool]:
+    duration = float(fmt["duration"])
+    res = int(streams[0]["width"]), int(streams[0]["height"])
+
+    return (duration, res, True)
+
+
+def _extract_duration(path: Path) -> tuple[float | None, bool]:
     """
-    Extract resolution and validity.
+    Get duration and validity.
     """
 
-    cmd = [
-        get_ffprobe(),
-        "-v",
-        "error",
-        "-select_streams",
-        "v:0",
-        "-show_entries",
-        "stream=width,height",
-        "-of",
-        "csv=p=0",
-        str(path),
-    ]
-
-    pipes = subprocess.Popen(
-        cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE
-    )
-    stdout, stderr = pipes.communicate()
-    stdout = stdout.decode().strip()
-
-    if pipes.returncode != 0 or len(stderr) > 0 or len(stdout) == 0:
-        res = None
+    cmd = [get_ffprobe(), *_DURATION_ARGS, str(path)]
+
+    proc = subprocess.run(cmd, capture_output=True)
+
+    # check status on raw bytes; only decode stdout on success
+    if proc.returncode != 0 or len(proc.stderr) > 0 or len(proc.stdout) == 0:
+        duration = None
         valid = False
     else:
-        split = stdout.split(",")
-        assert len(split) == 2
-        res = int(split[0]), int(split[1])
+        duration = float(proc.stdout.decode())
         valid = True
 
-    return (res, valid)
+    return (duration, valid)
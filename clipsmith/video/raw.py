@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime as DateTime
 from functools import cached_property
 from pathlib import Path
@@ -10,7 +12,7 @@ import yaml
 from pydantic import BaseModel
 
 from ..profile import BaseProfile
-from .base import BaseVideo, _extract_duration, _extract_res
+from .base import BaseVideo, _extract_metadata
 
 __all__ = [
     "BaseVideo",
@@ -20,10 +22,39 @@ __all__ = [
 
 RAW_CACHE_FILENAME = ".clipsmith_cache.yaml"
 
+# use libyaml's C implementation when available; an order of magnitude
+# faster than the pure-Python loader on large caches
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 VIDEO_SUFFIXES = [
     ".mp4",
 ]
 
+_probe_cache: dict[
+    tuple[str, int, int], tuple[float | None, tuple[int, int] | None, bool]
+] = {}
+"""
+Probe results keyed by (path, mtime, size) so re-scans within a process
+don't re-run ffprobe for unchanged files.
+"""
+
+
+def _extract_metadata_cached(
+    path: Path,
+) -> tuple[float | None, tuple[int, int] | None, bool]:
+    """
+    Get probe results for the given resolved path, memoized on the file's
+    identity and modification state.
+    """
+    stat = path.stat()
+    key = (str(path), stat.st_mtime_ns, stat.st_size)
+
+    if (meta := _probe_cache.get(key)) is None:
+        meta = _probe_cache[key] = _extract_metadata(path)
+
+    return meta
+
 
 class RawVideoMetadata(BaseModel):
     """
@@ -49,10 +80,7 @@ class RawVideoMetadata(BaseModel):
         Gets metadata from the given path.
         """
 
-        duration, duration_valid = _extract_duration(path.resolve())
-        res, res_valid = _extract_res(path.resolve())
-
-        valid = duration_valid and res_valid
+        duration, res, valid = _extract_metadata_cached(path.resolve())
 
         # TODO: try to extract datetime_start based on profile
 
@@ -110,47 +138,83 @@ class RawVideoCacheModel(BaseModel):
     videos: list[RawVideoMetadata]
 
     @classmethod
-    def _from_folder(cls, folder_path: Path) -> Self:
+    def _from_folder(cls, folder_path: Path) -> tuple[Self, bool]:
         """
-        Get model from folder, using the existing cache if present.
+        Get model from folder, reusing the existing cache where present and
+        probing only new files. Also returns whether the folder has drifted
+        from the cache (new or removed files).
         """
 
         cache_path = folder_path / RAW_CACHE_FILENAME
+        cached: dict[str, RawVideoMetadata] = {}
 
         if cache_path.exists():
             logging.info(f"Loading inputs from cache: '{cache_path}'")
 
             # load from cache
             with cache_path.open() as fh:
-                model_dict = yaml.safe_load(fh)
-
-            return cls(**model_dict)
-
-        # get models from videos
-        logging.info(f"Scanning inputs from folder: '{folder_path}'")
-
-        files = sorted(
-            (
-                p
-                for p in folder_path.iterdir()
-                if p.is_file()
-                and not p.name.startswith(".")
-                and p.suffix.lower() in VIDEO_SUFFIXES
-            ),
-            key=lambda p: p.name,
-        )
-
-        video_models = [
-            RawVideoMetadata._extract(p, root_path=folder_path) for p in files
-        ]
+                model_dict = yaml.load(fh, Loader=_YAML_LOADER)
+
+            cached = {m.filename: m for m in cls(**model_dict).videos}
+        else:
+            logging.info(f"Scanning inputs from folder: '{folder_path}'")
+
+        # scandir reuses dirent info instead of stat-ing each entry
+        with os.scandir(folder_path) as entries:
+            files = [
+                Path(e.path)
+                for e in sorted(
+                    (
+                        e
+                        for e in entries
+                        if e.is_file(follow_symlinks=False)
+                        and not e.name.startswith(".")
+                        and os.path.splitext(e.name)[1].lower()
+                        in VIDEO_SUFFIXES
+                    ),
+                    key=lambda e: e.name,
+                )
+            ]
+
+        to_probe = [p for p in files if p.name not in cached]
+
+        # probe files concurrently: ffprobe is dominated by process startup
+        # and I/O latency, so threads hide the serial fork/exec cost
+        if len(to_probe) > 1:
+            workers = min(len(to_probe), (os.cpu_count() or 1) * 2)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                probed = dict(
+                    zip(
+                        (p.name for p in to_probe),
+                        executor.map(
+                            lambda p: RawVideoMetadata._extract(
+                                p, root_path=folder_path
+                            ),
+                            to_probe,
+                        ),
+                    )
+                )
+        else:
+            probed = {
+                p.name: RawVideoMetadata._extract(p, root_path=folder_path)
+                for p in to_probe
+            }
 
-        for model in video_models:
+        for model in probed.values():
             if not model.valid:
                 logging.warning(
                     f"-> Found invalid input: '{folder_path / model.filename}'"
                 )
 
-        return cls(videos=video_models)
+        video_models = [
+            cached[p.name] if p.name in cached else probed[p.name]
+            for p in files
+        ]
+
+        # dirty if any file was newly probed or a cached entry disappeared
+        dirty = bool(to_probe) or len(cached) > len(files) - len(to_probe)
+
+        return cls(videos=video_models), dirty
 
 
 class RawVideoCache:
@@ -161,13 +225,19 @@ class RawVideoCache:
     folder_path: Path
     videos: list[RawVideo]
 
+    dirty: bool
+    """
+    Whether the folder contents have drifted from the cache file (or no
+    cache file exists yet).
+    """
+
     __model: RawVideoCacheModel
 
     def __init__(self, folder_path: Path):
         assert folder_path.is_dir()
 
         self.folder_path = folder_path
-        self.__model = RawVideoCacheModel._from_folder(folder_path)
+        self.__model, self.dirty = RawVideoCacheModel._from_folder(folder_path)
 
         # create video instances from metadata
         self.videos = [
@@ -195,13 +265,20 @@ class RawVideoCache:
 
     def write(self):
         """
-        Write .yaml cache of video listing.
+        Write .yaml cache of video listing, atomically replacing any
+        existing cache so a crash mid-write can't leave it corrupted.
         """
         logging.info(f"Writing cache: '{self.cache_path}'")
-        with self.cache_path.open("w") as fh:
-            yaml.safe_dump(
+
+        temp_path = self.cache_path.with_suffix(".yaml.tmp")
+        with temp_path.open("w") as fh:
+            yaml.dump(
                 self.__model.model_dump(),
                 fh,
+                Dumper=_YAML_DUMPER,
                 default_flow_style=False,
                 sort_keys=False,
             )
+        os.replace(temp_path, self.cache_path)
+
+        self.dirty = False
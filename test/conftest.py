@@ -1,5 +1,7 @@
+import functools
 import logging
 import math
+import os
 import shutil
 from pathlib import Path
 
@@ -16,15 +18,21 @@ TEST_ROOT = Path(__file__).parent
 SAMPLES_DIR = TEST_ROOT / "_samples" / "garmin-dashcam-mini2"
 TEMP_DIR = TEST_ROOT / "__temp__"
 
-SAMPLE_FILENAMES = [
-    p.name
-    for p in sorted(SAMPLES_DIR.iterdir(), key=lambda p: p.name)
-    if not p.name.startswith(".")
-]
-
 logging.basicConfig(level=logging.DEBUG)
 
 
+@functools.cache
+def get_sample_filenames() -> list[str]:
+    """
+    Get sorted sample filenames, scanning the samples folder on first use.
+    """
+    return [
+        p.name
+        for p in sorted(SAMPLES_DIR.iterdir(), key=lambda p: p.name)
+        if not p.name.startswith(".")
+    ]
+
+
 def pytest_addoption(parser: Parser):
     parser.addoption(
         "--keep-temp",
@@ -115,27 +123,44 @@ def check_clip(
     assert clip.resolution == video.resolution
 
 
+@functools.cache
+def _get_all_inputs() -> tuple[RawVideo, ...]:
+    """
+    Construct raw videos for all samples once and share them across tests;
+    they're immutable after construction.
+    """
+    return tuple(
+        RawVideo(SAMPLES_DIR / file, profile=GarminDashcamMini2)
+        for file in get_sample_filenames()
+    )
+
+
 def get_inputs(count: int | None = None) -> list[RawVideo]:
     """
     Get the provided number of samples as raw videos.
     """
-    count_ = count or len(SAMPLE_FILENAMES) - 1  # exclude invalid sample
-    return [
-        RawVideo(SAMPLES_DIR / file, profile=GarminDashcamMini2)
-        for file in SAMPLE_FILENAMES[:count_]
-    ]
+    inputs = _get_all_inputs()
+    count_ = count or len(inputs) - 1  # exclude invalid sample
+    return list(inputs[:count_])
+
+
+def copy_sample(src: Path | str, dst: Path | str):
+    """
+    Copy a sample file into a temp folder, hardlinking to skip the data
+    copy when both are on the same filesystem.
+    """
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy(src, dst)
 
 
 def _setup_dir(setup_path: Path) -> Path:
     """
     Ensure this folder exists and is empty.
     """
+    # remove the whole tree in one pass rather than per-entry
+    shutil.rmtree(setup_path, ignore_errors=True)
     setup_path.mkdir(parents=True, exist_ok=True)
 
-    for path in setup_path.iterdir():
-        if path.is_file():
-            path.unlink()
-        else:
-            shutil.rmtree(path)
-
     return setup_path
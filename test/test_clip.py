@@ -49,6 +49,37 @@ def test_concat_folder(context: Context, samples_dir: Path, output_dir: Path):
     check_clip(clip, sum(i.duration for i in get_inputs()))
 
 
+def test_concat_jobs(context: Context, output_dir: Path):
+    """
+    Forge independent clips concurrently.
+    """
+
+    inputs = get_inputs(2)
+
+    clip1 = context.forge(output_dir / "clip1.mp4", inputs)
+    clip2 = context.forge(output_dir / "clip2.mp4", inputs)
+    context.doit(jobs=2)
+
+    duration = sum(i.duration for i in inputs)
+    check_clip(clip1, duration)
+    check_clip(clip2, duration)
+
+
+def test_dedupe(context: Context, output_dir: Path):
+    """
+    Verify an identical forge returns the already-created clip.
+    """
+
+    inputs = get_inputs(2)
+
+    clip = context.forge(output_dir / "clip.mp4", inputs)
+    assert context.forge(output_dir / "clip.mp4", inputs) is clip
+
+    # different operation creates a distinct clip
+    operation = OperationParams(duration_params=DurationParams(target=5.0))
+    assert context.forge(output_dir / "clip.mp4", inputs, operation) is not clip
+
+
 def test_time_scale(context: Context, output_dir: Path):
     """
     Rescale time based on scale factor.
@@ -196,6 +227,31 @@ def test_res_scale(context: Context, output_dir: Path):
     check(clip2)
 
 
+def test_time_res_scale(context: Context, output_dir: Path):
+    """
+    Rescale time and resolution together, fusing both filters into a single
+    graph.
+    """
+
+    SCALE_FACTOR = 2.0
+
+    input_video = get_inputs(1)[0]
+    operation = OperationParams(
+        duration_params=DurationParams(scale=SCALE_FACTOR),
+        resolution_params=ResolutionParams(scale=0.5),
+        audio=False,
+    )
+
+    clip = context.forge(output_dir / "clip.mp4", input_video, operation)
+    context.doit()
+
+    check_clip(clip, input_video.duration * SCALE_FACTOR)
+    assert input_video.resolution == (
+        clip.resolution[0] * 2,
+        clip.resolution[1] * 2,
+    )
+
+
 def test_reforge(context: Context, output_dir: Path):
     """
     Reforge a forged clip.
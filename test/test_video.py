@@ -7,7 +7,7 @@ from clipsmith.context import Context, _normalize_inputs
 from clipsmith.profiles import GarminDashcamMini2
 from clipsmith.video.raw import RAW_CACHE_FILENAME, RawVideo, RawVideoCache
 
-from .conftest import SAMPLE_FILENAMES
+from .conftest import copy_sample, get_sample_filenames
 
 
 def test_read(samples_dir: Path):
@@ -37,7 +37,9 @@ def test_cache(
     context: Context, samples_dir: Path, input_dir: Path, output_dir: Path
 ):
     # copy samples to temp path
-    shutil.copytree(samples_dir, input_dir, dirs_exist_ok=True)
+    shutil.copytree(
+        samples_dir, input_dir, dirs_exist_ok=True, copy_function=copy_sample
+    )
 
     # create clip to write cache file
     _ = context.forge(
@@ -51,31 +53,68 @@ def test_cache(
     cache = RawVideoCache(input_dir)
 
     # validate cache object
-    assert [v.path.name for v in cache.videos] == SAMPLE_FILENAMES
+    assert [v.path.name for v in cache.videos] == get_sample_filenames()
     for video in cache.videos:
         assert video.path.is_file()
 
 
+def test_cache_incremental(samples_dir: Path, input_dir: Path):
+    """
+    Verify the cache picks up files added after it was written, probing
+    only the new ones.
+    """
+
+    last_filename = get_sample_filenames()[-1]
+
+    # copy samples to temp path, except last sample
+    for filename in get_sample_filenames()[:-1]:
+        copy_sample(samples_dir / filename, input_dir / filename)
+
+    # create and write cache
+    cache = RawVideoCache(input_dir)
+    assert cache.dirty
+    cache.write()
+    assert not cache.dirty
+
+    # reading back an unchanged folder is clean
+    assert not RawVideoCache(input_dir).dirty
+
+    # add the last sample; the cache should pick it up and become dirty
+    copy_sample(samples_dir / last_filename, input_dir / last_filename)
+
+    cache = RawVideoCache(input_dir)
+    assert cache.dirty
+    assert [v.path.name for v in cache.videos] == get_sample_filenames()
+
+    # removing a file also dirties the cache
+    cache.write()
+    (input_dir / last_filename).unlink()
+
+    cache = RawVideoCache(input_dir)
+    assert cache.dirty
+    assert [v.path.name for v in cache.videos] == get_sample_filenames()[:-1]
+
+
 def test_recurse(samples_dir: Path, input_dir: Path):
     """
     Verify collecting inputs from folder recursively.
     """
 
-    last_filename = SAMPLE_FILENAMES[-1]
+    last_filename = get_sample_filenames()[-1]
     last_input_dir = input_dir / "last"
 
     # copy samples to temp path, except last sample
-    for filename in SAMPLE_FILENAMES[:-1]:
-        shutil.copy(samples_dir / filename, input_dir / filename)
+    for filename in get_sample_filenames()[:-1]:
+        copy_sample(samples_dir / filename, input_dir / filename)
 
     # copy last sample
     last_input_dir.mkdir()
-    shutil.copy(samples_dir / last_filename, last_input_dir / last_filename)
+    copy_sample(samples_dir / last_filename, last_input_dir / last_filename)
 
     # get inputs without recursing
     flat_inputs = _normalize_inputs(input_dir, OperationParams())
-    assert [i.path.name for i in flat_inputs] == SAMPLE_FILENAMES[:-1]
+    assert [i.path.name for i in flat_inputs] == get_sample_filenames()[:-1]
 
     # get inputs with recursing
     recurse_inputs = _normalize_inputs(input_dir, OperationParams(recurse=True))
-    assert [i.path.name for i in recurse_inputs] == SAMPLE_FILENAMES
+    assert [i.path.name for i in recurse_inputs] == get_sample_filenames()